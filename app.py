@@ -4,43 +4,139 @@ Bird Feeding Flask Application
 A hobby project to track bird feeding activities using Nexus Repository for PyPI packages.
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, g, request, jsonify
 import sqlite3
-import datetime
 import json
+import functools
 import os
+import queue
 import requests
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from requests.adapters import HTTPAdapter, Retry
 
 from observe_logger import ObserveLogger, observe_track
 from java_integration import JavaBirdAnalyzer, JavaReportGenerator, MavenArtifactManager, check_java_availability
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Falls back to Flask's stdlib json provider
+
+try:
+    import msgspec
+    from typing import Annotated
+
+    class FeedingRecord(msgspec.Struct):
+        """Incoming feeding payload, parsed and validated in one C pass.
+
+        Constraints mirror the manual fallback (`if not data.get(field)`),
+        which rejects empty strings and zero quantities with a 400.
+        """
+        bird_type: Annotated[str, msgspec.Meta(min_length=1)]
+        food_type: Annotated[str, msgspec.Meta(min_length=1)]
+        quantity: Annotated[int, msgspec.Meta(gt=0)]
+        location: str = ''
+        notes: str = ''
+
+    # strict=False keeps the lax coercion the manual path has via
+    # int(data['quantity']), so {"quantity": "5"} stays accepted
+    _feeding_decoder = msgspec.json.Decoder(FeedingRecord, strict=False)
+except ImportError:
+    msgspec = None  # Falls back to manual per-field validation
+
 app = Flask(__name__)
 
+def _dumps_bytes(obj):
+    """Encode a payload to JSON bytes with the fastest available encoder"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+if orjson is not None:
+    from flask.json.provider import JSONProvider
+
+    class ORJSONProvider(JSONProvider):
+        """Serialize responses with orjson's C encoder instead of stdlib json"""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = ORJSONProvider(app)
+
 # Initialize Observe logging
 observe_logger = ObserveLogger(app, 'config/observe_config.json')
 app.observe_logger = observe_logger
 
+# Business events are queued and written by a daemon thread so logger
+# I/O never adds latency to the request path
+_log_q = queue.Queue(maxsize=1000)
+
+def _drain_log_queue():
+    while True:
+        event_type, data, level, request_id, timestamp = _log_q.get()
+        try:
+            observe_logger.log_business_event(event_type, data, level,
+                                              request_id=request_id,
+                                              timestamp=timestamp)
+        except Exception as e:
+            print(f"Warning: background log write failed: {e}")
+
+def _log_async(event_type, data, level='INFO'):
+    """Queue a business event without blocking the request.
+
+    The request id and timestamp are captured here, on the request
+    thread — flask.g is not readable from the drain thread.
+    """
+    try:
+        request_id = getattr(g, 'request_id', 'no-request')
+    except RuntimeError:
+        request_id = 'no-request'
+    try:
+        _log_q.put_nowait((event_type, data, level, request_id, time.time()))
+    except queue.Full:
+        pass  # Drop rather than stall the request on a saturated logger
+
+threading.Thread(target=_drain_log_queue, daemon=True).start()
+
 # Database configuration
 DATABASE = 'bird_feedings.db'
 
+# Shared session for Nexus calls - reuses sockets instead of paying a
+# fresh DNS lookup + TCP handshake per request
+_NEXUS = requests.Session()
+_NEXUS.auth = ('admin', 'admin123')
+_NEXUS.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                                    max_retries=Retry(total=1, backoff_factor=0.2)))
+
+@functools.lru_cache(maxsize=1)
 def load_db_config():
-    """Load database configuration from local file or Nexus"""
+    """Load database configuration from local file or Nexus (cached)"""
     try:
-        # Try to load from local config file first
-        if os.path.exists('config/db_config.json'):
+        # Try to load from local config file first (EAFP: one open()
+        # instead of a stat() followed by an open())
+        try:
             with open('config/db_config.json', 'r') as f:
                 config = json.load(f)
                 return config.get('database', {})
-        
+        except FileNotFoundError:
+            pass
+
         # Fallback: Try to fetch from Nexus (if configured)
+        # Short timeout so a down Nexus can't stall worker startup
         nexus_url = "http://localhost:8081/repository/test-raw/db_config.json"
         try:
-            response = requests.get(nexus_url, auth=('admin', 'admin123'))
+            response = _NEXUS.get(nexus_url, timeout=(0.5, 1.0))
             if response.status_code == 200:
                 print("📦 Loading database config from Nexus Repository!")
                 config = response.json()
                 return config.get('database', {})
-        except Exception as e:
+        except requests.RequestException as e:
             print(f"Warning: Could not fetch config from Nexus: {e}")
         
         # Default configuration
@@ -59,33 +155,188 @@ def load_db_config():
 DB_CONFIG = load_db_config()
 DATABASE = DB_CONFIG.get('path', 'bird_feedings.db')
 
-def get_db_connection():
-    """Create a database connection"""
-    conn = sqlite3.connect(DATABASE)
-    conn.row_factory = sqlite3.Row  # This enables column access by name
+# Connection pool configuration
+POOL_SIZE = 5
+
+# SQL hoisted to module level so the sqlite3 statement cache hits on the
+# same string object instead of re-parsing per request
+# RETURNING hands back the stored timestamp, saving a datetime
+# allocation per POST and guaranteeing the response matches the row
+_SQL_INSERT = '''
+    INSERT INTO bird_feedings (bird_type, food_type, quantity, location, notes)
+    VALUES (?, ?, ?, ?, ?)
+    RETURNING id, feeding_time
+'''
+_SQL_LIST = '''
+    SELECT * FROM bird_feedings
+    ORDER BY feeding_time DESC
+    LIMIT 50
+'''
+_SQL_LIST_ALL = '''
+    SELECT * FROM bird_feedings
+    ORDER BY feeding_time DESC
+'''
+# Single round-trip for /api/stats: count, sum and both "most common"
+# lookups come back in one row instead of four separate scans
+_SQL_STATS = '''
+    WITH agg AS (
+        SELECT COUNT(*) AS total, COALESCE(SUM(quantity), 0) AS quantity
+        FROM bird_feedings
+    )
+    SELECT agg.total,
+           agg.quantity,
+           (SELECT bird_type FROM bird_feedings
+            GROUP BY bird_type ORDER BY COUNT(*) DESC LIMIT 1),
+           (SELECT food_type FROM bird_feedings
+            GROUP BY food_type ORDER BY COUNT(*) DESC LIMIT 1)
+    FROM agg
+'''
+
+# /api/stats is identical for every client between writes, so cache the
+# serialized body briefly and drop it whenever a feeding is inserted
+_STATS_TTL = 2.0
+_stats_cache = {'t': 0.0, 'body': None}
+
+# The ETag for /api/feedings GET derives from table state
+# (MAX(id)/COUNT(*)), so it survives restarts and stays consistent
+# across gunicorn workers; an unchanged table short-circuits to a 304
+_feedings_cache = {'etag': None, 'body': None}
+
+def _create_pooled_connection():
+    """Create a long-lived connection suitable for sharing across requests"""
+    conn = sqlite3.connect(DATABASE, check_same_thread=False, isolation_level=None,
+                           cached_statements=128)
+    # Default tuple rows: every hot path unpacks positionally, so skip
+    # sqlite3.Row's per-field name lookup overhead
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA cache_size=-20000')
     return conn
 
+# Prefill the pool once at import so requests never pay the connect cost
+_pool = queue.Queue(maxsize=POOL_SIZE)
+for _ in range(POOL_SIZE):
+    _pool.put(_create_pooled_connection())
+
+# Write coalescing: inserts queue up and a single writer thread flushes
+# them in one transaction, so N concurrent POSTs share one fsync
+_WRITE_BATCH_MAX = 64
+_write_q = queue.Queue()
+
+def _drain_write_queue():
+    writer = _create_pooled_connection()
+    while True:
+        batch = [_write_q.get()]
+        while len(batch) < _WRITE_BATCH_MAX:
+            try:
+                batch.append(_write_q.get(timeout=0.005))
+            except queue.Empty:
+                break
+
+        try:
+            writer.execute('BEGIN IMMEDIATE')
+            rows = [writer.execute(_SQL_INSERT, params).fetchone()
+                    for params, _ in batch]
+            writer.execute('COMMIT')
+        except Exception as e:
+            # ROLLBACK itself can fail (e.g. BEGIN IMMEDIATE lost the
+            # lock race, so no transaction is active) - it must never
+            # kill the writer thread or leave futures unresolved
+            try:
+                writer.execute('ROLLBACK')
+            except sqlite3.Error:
+                pass
+            # The connection may be wedged; start the next batch fresh
+            try:
+                writer.close()
+            except Exception:
+                pass
+            writer = _create_pooled_connection()
+            for _, future in batch:
+                future.set_exception(e)
+        else:
+            for (_, future), row in zip(batch, rows):
+                future.set_result((row[0], row[1]))
+
+def _queue_insert(params):
+    """Queue an insert; returns the assigned (id, feeding_time) pair"""
+    future = Future()
+    _write_q.put((params, future))
+    return future.result(timeout=2)
+
+threading.Thread(target=_drain_write_queue, daemon=True).start()
+
+@contextmanager
+def borrow_conn():
+    """Borrow a connection from the pool, returning it on release"""
+    conn = _pool.get()
+    try:
+        yield conn
+    finally:
+        _pool.put(conn)
+
+# /api/analyze and /api/report run the same scan + analysis; memoize on
+# the rowset version so an unchanged table is only analyzed once
+_SQL_VERSION = 'SELECT MAX(id), COUNT(*) FROM bird_feedings'
+_analysis_cache = {'ver': None, 'rows': None, 'result': None}
+
+# Column order of SELECT * on bird_feedings, for positional row handling
+_FIELDS = ('id', 'bird_type', 'food_type', 'quantity',
+           'location', 'feeding_time', 'notes')
+
+def _compute_analysis():
+    """Fetch all feedings and analyze them, reusing the cached result
+    when the table hasn't changed"""
+    with borrow_conn() as conn:
+        version = conn.execute(_SQL_VERSION).fetchone()
+        if version == _analysis_cache['ver'] and _analysis_cache['result'] is not None:
+            return _analysis_cache['rows'], _analysis_cache['result']
+
+        feeding_list = [dict(zip(_FIELDS, row))
+                        for row in conn.execute(_SQL_LIST_ALL)]
+
+    analyzer = JavaBirdAnalyzer()
+    result = analyzer.analyze_feeding_patterns(feeding_list)
+
+    _analysis_cache['ver'] = version
+    _analysis_cache['rows'] = feeding_list
+    _analysis_cache['result'] = result
+    return feeding_list, result
+
 def init_database():
     """Initialize the database with required tables"""
-    conn = get_db_connection()
-    conn.execute('''
-        CREATE TABLE IF NOT EXISTS bird_feedings (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            bird_type TEXT NOT NULL,
-            food_type TEXT NOT NULL,
-            quantity INTEGER NOT NULL,
-            location TEXT,
-            feeding_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            notes TEXT
-        )
-    ''')
-    conn.commit()
-    conn.close()
+    with borrow_conn() as conn:
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS bird_feedings (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                bird_type TEXT NOT NULL,
+                food_type TEXT NOT NULL,
+                quantity INTEGER NOT NULL,
+                location TEXT,
+                feeding_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                notes TEXT
+            )
+        ''')
+        # Indexes so the stats GROUP BYs run as index scans
+        conn.execute('CREATE INDEX IF NOT EXISTS ix_bird_type ON bird_feedings(bird_type)')
+        conn.execute('CREATE INDEX IF NOT EXISTS ix_food_type ON bird_feedings(food_type)')
+        # Lets the LIMIT 50 listing walk the index instead of sorting the table
+        conn.execute('CREATE INDEX IF NOT EXISTS ix_feeding_time ON bird_feedings(feeding_time DESC)')
+
+# Java availability can't change within a process lifetime, so probe once
+_java_availability = functools.lru_cache(maxsize=1)(check_java_availability)
+
+# The home payload is constant; serialize it on first hit and reuse
+_home_cache = {'body': None}
 
 @app.route('/')
 def home():
     """API information endpoint"""
-    return jsonify({
+    if _home_cache['body'] is not None:
+        return Response(_home_cache['body'], mimetype='application/json')
+
+    _home_cache['body'] = _dumps_bytes({
         'message': '🐦 Bird Feeding API',
         'description': 'A hobby project to track bird feeding activities using Nexus Repository for PyPI packages',
         'endpoints': {
@@ -101,54 +352,70 @@ def home():
             'notes': 'Morning feeding'
         },
         'java_integration': {
-            'available': check_java_availability(),
+            'available': _java_availability(),
             'features': ['Advanced Analytics', 'PDF Reports', 'Maven Artifacts']
         }
     })
+    return Response(_home_cache['body'], mimetype='application/json')
 
 @app.route('/api/feedings', methods=['POST'])
 @observe_track('bird_feeding_created')
 def add_feeding():
     """Add a new bird feeding record"""
     try:
-        data = request.get_json()
-        
+        if msgspec is not None:
+            # Schema compiled once: decode + validate + coerce in C
+            try:
+                record = _feeding_decoder.decode(request.get_data())
+            except (msgspec.ValidationError, msgspec.DecodeError) as e:
+                _log_async('feeding_validation_failed', {
+                    'error': str(e)
+                }, 'WARNING')
+                return jsonify({'error': f'Invalid feeding payload: {e}'}), 400
+
+            data = {
+                'bird_type': record.bird_type,
+                'food_type': record.food_type,
+                'quantity': record.quantity,
+                'location': record.location,
+                'notes': record.notes
+            }
+        else:
+            data = request.get_json()
+
+            # Validate required fields
+            required_fields = ['bird_type', 'food_type', 'quantity']
+            for field in required_fields:
+                if not data.get(field):
+                    _log_async('feeding_validation_failed', {
+                        'missing_field': field,
+                        'provided_data': list(data.keys())
+                    }, 'WARNING')
+                    return jsonify({'error': f'Missing required field: {field}'}), 400
+            data['quantity'] = int(data['quantity'])
+
         # Log business event
-        app.observe_logger.log_business_event('feeding_request_received', {
-            'bird_type': data.get('bird_type'),
-            'food_type': data.get('food_type'),
-            'quantity': data.get('quantity')
+        _log_async('feeding_request_received', {
+            'bird_type': data['bird_type'],
+            'food_type': data['food_type'],
+            'quantity': data['quantity']
         })
-        
-        # Validate required fields
-        required_fields = ['bird_type', 'food_type', 'quantity']
-        for field in required_fields:
-            if not data.get(field):
-                app.observe_logger.log_business_event('feeding_validation_failed', {
-                    'missing_field': field,
-                    'provided_data': list(data.keys())
-                }, 'WARNING')
-                return jsonify({'error': f'Missing required field: {field}'}), 400
-        
-        # Insert into database
-        conn = get_db_connection()
-        cursor = conn.execute('''
-            INSERT INTO bird_feedings (bird_type, food_type, quantity, location, notes)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (
+
+        # Insert via the coalescing write queue
+        feeding_id, feeding_time = _queue_insert((
             data['bird_type'],
             data['food_type'],
-            int(data['quantity']),
+            data['quantity'],
             data.get('location', ''),
             data.get('notes', '')
         ))
-        
-        feeding_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        
+
+        # The table changed: drop the cached stats body (the feedings
+        # ETag derives from table state and needs no explicit bump)
+        _stats_cache['body'] = None
+
         # Log successful creation
-        app.observe_logger.log_business_event('feeding_created_successfully', {
+        _log_async('feeding_created_successfully', {
             'feeding_id': feeding_id,
             'bird_type': data['bird_type'],
             'food_type': data['food_type'],
@@ -158,7 +425,7 @@ def add_feeding():
         return jsonify({
             'message': 'Feeding recorded successfully',
             'id': feeding_id,
-            'timestamp': datetime.datetime.now().isoformat()
+            'timestamp': feeding_time
         }), 201
         
     except Exception as e:
@@ -169,40 +436,108 @@ def add_feeding():
         })
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/feedings/batch', methods=['POST'])
+@observe_track('bird_feedings_batch_created')
+def add_feedings_batch():
+    """Add multiple feeding records in a single request"""
+    try:
+        # silent=True turns malformed JSON / wrong Content-Type into None
+        # instead of a BadRequest that the except below would remap to 500
+        payload = request.get_json(silent=True)
+        feedings = payload.get('feedings') if isinstance(payload, dict) else payload
+        if not isinstance(feedings, list) or not feedings:
+            return jsonify({'error': 'Expected a non-empty list of feedings'}), 400
+
+        try:
+            rows = [(d['bird_type'], d['food_type'], int(d['quantity']),
+                     d.get('location', ''), d.get('notes', ''))
+                    for d in feedings]
+        except (KeyError, TypeError, ValueError) as e:
+            return jsonify({'error': f'Invalid feeding record: {e}'}), 400
+
+        # Enqueue every row before waiting on any result, so the writer
+        # thread coalesces the whole batch into one transaction
+        futures = []
+        for params in rows:
+            future = Future()
+            _write_q.put((params, future))
+            futures.append(future)
+        ids = [future.result(timeout=5)[0] for future in futures]
+
+        _stats_cache['body'] = None
+
+        _log_async('feedings_batch_created', {
+            'records_inserted': len(ids)
+        })
+
+        return jsonify({
+            'message': 'Feedings recorded successfully',
+            'count': len(ids),
+            'ids': ids
+        }), 201
+
+    except Exception as e:
+        app.observe_logger.log_error(e, {
+            'endpoint': '/api/feedings/batch',
+            'method': 'POST'
+        })
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/feedings', methods=['GET'])
 @observe_track('bird_feedings_retrieved')
 def get_feedings():
     """Get all bird feeding records"""
     try:
-        conn = get_db_connection()
-        feedings = conn.execute('''
-            SELECT * FROM bird_feedings 
-            ORDER BY feeding_time DESC 
-            LIMIT 50
-        ''').fetchall()
-        conn.close()
-        
-        # Convert to list of dictionaries
+        with borrow_conn() as conn:
+            # Cheap MAX(id)/COUNT(*) probe identifies the table state:
+            # unlike a process-local counter it is valid after restarts
+            # and shared correctly across gunicorn workers
+            max_id, row_count = conn.execute(_SQL_VERSION).fetchone()
+            etag = f'{max_id or 0}-{row_count}'
+
+            # Client already holds the current listing
+            if request.headers.get('If-None-Match') == etag:
+                return '', 304
+
+            # Table unchanged since the last build - reuse the body
+            if _feedings_cache['etag'] == etag and _feedings_cache['body'] is not None:
+                return Response(_feedings_cache['body'], mimetype='application/json',
+                                headers={'ETag': etag})
+
+            feedings = conn.execute(_SQL_LIST).fetchall()
+
+        # Single pass: build the response rows and accumulate the log
+        # metrics in the same loop (positional unpack, table column order)
         feeding_list = []
-        for feeding in feedings:
+        unique_birds = set()
+        total_quantity = 0
+        for (row_id, bird_type, food_type, quantity,
+             location, feeding_time, notes) in feedings:
             feeding_list.append({
-                'id': feeding['id'],
-                'bird_type': feeding['bird_type'],
-                'food_type': feeding['food_type'],
-                'quantity': feeding['quantity'],
-                'location': feeding['location'],
-                'notes': feeding['notes'],
-                'feeding_time': feeding['feeding_time']
+                'id': row_id,
+                'bird_type': bird_type,
+                'food_type': food_type,
+                'quantity': quantity,
+                'location': location,
+                'notes': notes,
+                'feeding_time': feeding_time
             })
-        
+            unique_birds.add(bird_type)
+            total_quantity += quantity
+
         # Log business metrics
-        app.observe_logger.log_business_event('feedings_retrieved', {
+        _log_async('feedings_retrieved', {
             'total_records': len(feeding_list),
-            'unique_birds': len(set(f['bird_type'] for f in feeding_list)),
-            'total_quantity': sum(f['quantity'] for f in feeding_list)
+            'unique_birds': len(unique_birds),
+            'total_quantity': total_quantity
         })
-        
-        return jsonify(feeding_list)
+
+        body = _dumps_bytes(feeding_list)
+        _feedings_cache['etag'] = etag
+        _feedings_cache['body'] = body
+
+        return Response(body, mimetype='application/json',
+                        headers={'ETag': etag})
         
     except Exception as e:
         app.observe_logger.log_error(e, {
@@ -215,40 +550,25 @@ def get_feedings():
 def get_stats():
     """Get feeding statistics"""
     try:
-        conn = get_db_connection()
-        
-        # Total feedings
-        total_feedings = conn.execute('SELECT COUNT(*) FROM bird_feedings').fetchone()[0]
-        
-        # Most common bird type
-        common_bird = conn.execute('''
-            SELECT bird_type, COUNT(*) as count 
-            FROM bird_feedings 
-            GROUP BY bird_type 
-            ORDER BY count DESC 
-            LIMIT 1
-        ''').fetchone()
-        
-        # Most common food type
-        common_food = conn.execute('''
-            SELECT food_type, COUNT(*) as count 
-            FROM bird_feedings 
-            GROUP BY food_type 
-            ORDER BY count DESC 
-            LIMIT 1
-        ''').fetchone()
-        
-        # Total food quantity
-        total_quantity = conn.execute('SELECT SUM(quantity) FROM bird_feedings').fetchone()[0] or 0
-        
-        conn.close()
-        
-        return jsonify({
+        # Serve the pre-serialized body while it is fresh
+        if _stats_cache['body'] is not None and \
+                time.monotonic() - _stats_cache['t'] < _STATS_TTL:
+            return Response(_stats_cache['body'], mimetype='application/json')
+
+        with borrow_conn() as conn:
+            total_feedings, total_quantity, common_bird, common_food = \
+                conn.execute(_SQL_STATS).fetchone()
+
+        body = _dumps_bytes({
             'total_feedings': total_feedings,
-            'most_common_bird': common_bird[0] if common_bird else None,
-            'most_common_food': common_food[0] if common_food else None,
+            'most_common_bird': common_bird,
+            'most_common_food': common_food,
             'total_food_quantity': total_quantity
         })
+        _stats_cache['body'] = body
+        _stats_cache['t'] = time.monotonic()
+
+        return Response(body, mimetype='application/json')
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -258,39 +578,16 @@ def get_stats():
 def analyze_with_java():
     """Advanced analysis using Java libraries"""
     try:
-        # Get all feeding records for analysis
-        conn = get_db_connection()
-        feedings = conn.execute('''
-            SELECT * FROM bird_feedings 
-            ORDER BY feeding_time DESC
-        ''').fetchall()
-        conn.close()
-        
-        # Convert to list of dictionaries
-        feeding_list = []
-        for feeding in feedings:
-            feeding_list.append({
-                'id': feeding['id'],
-                'bird_type': feeding['bird_type'],
-                'food_type': feeding['food_type'],
-                'quantity': feeding['quantity'],
-                'location': feeding['location'],
-                'notes': feeding['notes'],
-                'feeding_time': feeding['feeding_time']
-            })
-        
+        feeding_list, analysis_result = _compute_analysis()
+
         # Log business event
-        app.observe_logger.log_business_event('java_analysis_started', {
+        _log_async('java_analysis_started', {
             'total_records': len(feeding_list),
             'analysis_type': 'pattern_analysis'
         })
-        
-        # Use Java analyzer
-        analyzer = JavaBirdAnalyzer()
-        analysis_result = analyzer.analyze_feeding_patterns(feeding_list)
-        
+
         # Log successful analysis
-        app.observe_logger.log_business_event('java_analysis_completed', {
+        _log_async('java_analysis_completed', {
             'records_analyzed': len(feeding_list),
             'analysis_engine': analysis_result.get('analysis_engine', 'Unknown')
         })
@@ -313,17 +610,8 @@ def generate_report():
         data = request.get_json()
         report_type = data.get('type', 'summary')
         
-        # Get analysis data
-        analyzer = JavaBirdAnalyzer()
-        conn = get_db_connection()
-        feedings = conn.execute('''
-            SELECT * FROM bird_feedings 
-            ORDER BY feeding_time DESC
-        ''').fetchall()
-        conn.close()
-        
-        feeding_list = [dict(feeding) for feeding in feedings]
-        analysis_data = analyzer.analyze_feeding_patterns(feeding_list)
+        # Reuses the cached analysis when the table hasn't changed
+        feeding_list, analysis_data = _compute_analysis()
         
         # Generate report
         report_generator = JavaReportGenerator()
@@ -333,7 +621,7 @@ def generate_report():
         success = report_generator.generate_pdf_report(analysis_data, output_path)
         
         if success:
-            app.observe_logger.log_business_event('report_generated', {
+            _log_async('report_generated', {
                 'report_type': report_type,
                 'output_path': output_path,
                 'records_included': len(feeding_list)
@@ -378,10 +666,21 @@ def java_status():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def create_app():
+    """Application factory for WSGI servers.
+
+    Run in production with:
+        gunicorn -k gthread -w 4 --threads 8 --bind 0.0.0.0:8080 'app:create_app()'
+    WAL mode plus the connection pool let multiple workers serve
+    concurrent traffic without blocking each other.
+    """
+    init_database()
+    return app
+
 if __name__ == '__main__':
     # Initialize database on startup
     init_database()
-    
+
     print("🐦 Bird Feeding API Starting...")
     print("📦 Using Nexus Repository for PyPI packages!")
     print("🌐 API Base URL: http://localhost:8080")
@@ -390,5 +689,7 @@ if __name__ == '__main__':
     print("   POST /api/feedings  - Add new feeding")
     print("   GET  /api/feedings  - Get all feedings")
     print("   GET  /api/stats     - Get statistics")
-    
-    app.run(debug=True, host='0.0.0.0', port=8080)
+    print("💡 For production use: gunicorn -k gthread -w 4 --threads 8 --bind 0.0.0.0:8080 'app:create_app()'")
+
+    # Dev server only; debug instrumentation is opt-in via FLASK_DEBUG
+    app.run(debug=bool(os.environ.get('FLASK_DEBUG')), host='0.0.0.0', port=8080)
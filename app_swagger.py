@@ -5,18 +5,111 @@ A hobby project to track bird feeding activities using Nexus Repository for PyPI
 """
 
 from flask import Flask, request
-from flask_restx import Api, Resource, fields
+from flask_restx import Api, Namespace, Resource, fields
+from werkzeug.exceptions import HTTPException
 import sqlite3
 import datetime
 import json
 import os
+import queue
 import requests
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
 from observe_logger import ObserveLogger, observe_track
-from java_integration import JavaBirdAnalyzer, JavaReportGenerator, MavenArtifactManager, check_java_availability
+
+# Java integration is optional: without it the app still serves the
+# feeding and stats endpoints, just no /java/ namespace
+try:
+    from java_integration import JavaBirdAnalyzer, JavaReportGenerator, MavenArtifactManager, check_java_availability
+    JAVA_INTEGRATION_AVAILABLE = True
+except ImportError:
+    JAVA_INTEGRATION_AVAILABLE = False
+
+# Heavyweight Java bridges (JVM / subprocess setup) are process-wide
+# singletons so their startup cost is paid once, not per request
+_java_singletons = {}
+_java_singleton_lock = threading.Lock()
+
+def _get_singleton(cls):
+    """Return the shared instance of a Java bridge class, creating it once"""
+    instance = _java_singletons.get(cls)
+    if instance is None:
+        with _java_singleton_lock:
+            instance = _java_singletons.get(cls)
+            if instance is None:
+                instance = _java_singletons[cls] = cls()
+    return instance
+
+# The Java runtime doesn't change mid-process, so probe once at import
+# instead of forking `java -version` on every request
+JAVA_AVAILABLE = check_java_availability() if JAVA_INTEGRATION_AVAILABLE else {'available': False}
+
+# JAR directory listing, refreshed at most once a minute
+_JAR_CACHE_TTL = 60.0
+_jar_cache = {'t': 0.0, 'files': None}
+
+def _list_jar_files():
+    """List JARs in java/ with a short TTL cache on the directory scan"""
+    if _jar_cache['files'] is None or time.monotonic() - _jar_cache['t'] > _JAR_CACHE_TTL:
+        jar_files = []
+        if os.path.exists('java/'):
+            jar_files = [f for f in os.listdir('java/') if f.endswith('.jar')]
+        _jar_cache['files'] = jar_files
+        _jar_cache['t'] = time.monotonic()
+    return _jar_cache['files']
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Falls back to Flask's stdlib json provider
+
+try:
+    import msgspec
+    from typing import Annotated
+
+    class FeedingRecord(msgspec.Struct):
+        """Incoming feeding payload, parsed and validated in one C pass.
+
+        Constraints mirror the manual fallback (`if not data.get(field)`),
+        which rejects empty strings and zero quantities with a 400.
+        """
+        bird_type: Annotated[str, msgspec.Meta(min_length=1)]
+        food_type: Annotated[str, msgspec.Meta(min_length=1)]
+        quantity: Annotated[int, msgspec.Meta(gt=0)]
+        location: str = ''
+        notes: str = ''
+
+    # strict=False keeps the lax coercion the manual path has via
+    # int(data['quantity']), so {"quantity": "5"} stays accepted
+    _feeding_decoder = msgspec.json.Decoder(FeedingRecord, strict=False)
+except ImportError:
+    msgspec = None  # Falls back to manual per-field validation
 
 app = Flask(__name__)
 
+if orjson is not None:
+    from flask.json.provider import JSONProvider
+
+    class ORJSONProvider(JSONProvider):
+        """Back Flask's JSON hooks (request.get_json etc.) with orjson.
+
+        flask-restx serializes Resource responses through its own
+        representation, not this provider - see the api.representation
+        registration below.
+        """
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = ORJSONProvider(app)
+
 # Configure Flask-RESTX
 api = Api(
     app,
@@ -26,6 +119,17 @@ api = Api(
     doc='/swagger/'
 )
 
+if orjson is not None:
+    # flask-restx renders every Resource return (and error body) through
+    # its registered representation, bypassing Flask's JSON provider, so
+    # the C encoder has to be plugged in here to take effect
+    @api.representation('application/json')
+    def _orjson_representation(data, code, headers=None):
+        resp = app.make_response((orjson.dumps(data), code))
+        resp.headers['Content-Type'] = 'application/json'
+        resp.headers.extend(headers or {})
+        return resp
+
 # Initialize Observe logging
 observe_logger = ObserveLogger(app, 'config/observe_config.json')
 app.observe_logger = observe_logger
@@ -42,16 +146,19 @@ def load_db_config():
                 config = json.load(f)
                 return config.get('database', {})
 
-        # Fallback: Try to fetch from Nexus (if configured)
-        nexus_url = "http://localhost:8081/repository/test-raw/db_config.json"
-        try:
-            response = requests.get(nexus_url, auth=('admin', 'admin123'))
-            if response.status_code == 200:
-                print("📦 Loading database config from Nexus Repository!")
-                config = response.json()
-                return config.get('database', {})
-        except Exception as e:
-            print(f"Warning: Could not fetch config from Nexus: {e}")
+        # Fallback: Try to fetch from Nexus - opt-in only, so the default
+        # deployment never blocks startup on a network call
+        if os.environ.get('USE_NEXUS_CONFIG') == '1':
+            nexus_url = "http://localhost:8081/repository/test-raw/db_config.json"
+            try:
+                response = requests.get(nexus_url, auth=('admin', 'admin123'),
+                                        timeout=(0.25, 0.5))
+                if response.status_code == 200:
+                    print("📦 Loading database config from Nexus Repository!")
+                    config = response.json()
+                    return config.get('database', {})
+            except requests.RequestException as e:
+                print(f"Warning: Could not fetch config from Nexus: {e}")
 
         # Default configuration
         return {
@@ -69,28 +176,97 @@ def load_db_config():
 DB_CONFIG = load_db_config()
 DATABASE = DB_CONFIG.get('path', 'bird_feedings.db')
 
-def get_db_connection():
-    """Create a database connection"""
-    conn = sqlite3.connect(DATABASE)
+# Connection pool configuration
+POOL_SIZE = 8
+
+# Required POST fields, hoisted so the hot path doesn't rebuild the list
+REQUIRED_FIELDS = ('bird_type', 'food_type', 'quantity')
+
+# SQL hoisted to module level so sqlite3's prepared-statement cache is
+# keyed on the same string object instead of re-parsing per request
+SQL_INSERT_FEEDING = '''
+    INSERT INTO bird_feedings (bird_type, food_type, quantity, location, notes)
+    VALUES (?, ?, ?, ?, ?)
+'''
+SQL_SELECT_RECENT = '''
+    SELECT * FROM bird_feedings
+    ORDER BY feeding_time DESC
+    LIMIT 50
+'''
+SQL_SELECT_ALL = '''
+    SELECT * FROM bird_feedings
+    ORDER BY feeding_time DESC
+'''
+SQL_SELECT_PAGE = '''
+    SELECT * FROM bird_feedings
+    ORDER BY feeding_time DESC
+    LIMIT ? OFFSET ?
+'''
+# Log metrics for the recent-50 window, aggregated in C by SQLite
+# instead of Python set/sum passes. Pushing reductions into SQL beats
+# JIT-compiling them app-side: no warmup and no extra dependency.
+SQL_RECENT_METRICS = '''
+    SELECT COUNT(DISTINCT bird_type), COALESCE(SUM(quantity), 0)
+    FROM (SELECT bird_type, quantity FROM bird_feedings
+          ORDER BY feeding_time DESC LIMIT 50)
+'''
+# All four stats come back in one row, sharing a single scan instead of
+# four separate prepare/step round-trips
+SQL_STATS = '''
+    SELECT (SELECT COUNT(*) FROM bird_feedings),
+           (SELECT bird_type FROM bird_feedings
+            GROUP BY bird_type ORDER BY COUNT(*) DESC LIMIT 1),
+           (SELECT food_type FROM bird_feedings
+            GROUP BY food_type ORDER BY COUNT(*) DESC LIMIT 1),
+           (SELECT COALESCE(SUM(quantity), 0) FROM bird_feedings)
+'''
+
+def _create_pooled_connection():
+    """Create a long-lived connection suitable for sharing across requests"""
+    conn = sqlite3.connect(DATABASE, check_same_thread=False, isolation_level=None,
+                           cached_statements=256)
     conn.row_factory = sqlite3.Row  # This enables column access by name
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA cache_size=-64000')
+    conn.execute('PRAGMA temp_store=MEMORY')
     return conn
 
+# Prefill the pool once at import so requests never pay the connect cost
+POOL = queue.Queue(maxsize=POOL_SIZE)
+for _ in range(POOL_SIZE):
+    POOL.put(_create_pooled_connection())
+
+@contextmanager
+def db_conn():
+    """Borrow a pooled connection, returning it on release"""
+    conn = POOL.get()
+    try:
+        yield conn
+    finally:
+        POOL.put(conn)
+
 def init_database():
     """Initialize the database with required tables"""
-    conn = get_db_connection()
-    conn.execute('''
-        CREATE TABLE IF NOT EXISTS bird_feedings (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            bird_type TEXT NOT NULL,
-            food_type TEXT NOT NULL,
-            quantity INTEGER NOT NULL,
-            location TEXT,
-            feeding_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            notes TEXT
-        )
-    ''')
-    conn.commit()
-    conn.close()
+    with db_conn() as conn:
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS bird_feedings (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                bird_type TEXT NOT NULL,
+                food_type TEXT NOT NULL,
+                quantity INTEGER NOT NULL,
+                location TEXT,
+                feeding_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                notes TEXT
+            )
+        ''')
+        # Indexes turn the LIMIT 50 listing into a bounded index walk and
+        # let the stats GROUP BYs aggregate via index
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_feeding_time ON bird_feedings(feeding_time DESC)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_bird ON bird_feedings(bird_type)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_food ON bird_feedings(food_type)')
+        # Refresh planner statistics so the new indexes get picked
+        conn.execute('ANALYZE')
 
 # Define API models for Swagger documentation
 feeding_model = api.model('BirdFeeding', {
@@ -126,7 +302,9 @@ java_status_model = api.model('JavaStatus', {
 })
 
 analysis_request_model = api.model('AnalysisRequest', {
-    'type': fields.String(description='Type of analysis to perform', example='pattern_analysis')
+    'type': fields.String(description='Type of analysis to perform', example='pattern_analysis'),
+    'limit': fields.Integer(description='Maximum number of records to analyze (all when omitted)', example=1000),
+    'offset': fields.Integer(description='Number of most recent records to skip', example=0)
 })
 
 report_request_model = api.model('ReportRequest', {
@@ -136,7 +314,10 @@ report_request_model = api.model('ReportRequest', {
 # Define namespaces
 feedings_ns = api.namespace('feedings', description='Bird feeding operations')
 stats_ns = api.namespace('stats', description='Feeding statistics')
-java_ns = api.namespace('java', description='Java integration features')
+# The java namespace is only registered when the integration imports
+java_ns = Namespace('java', description='Java integration features')
+if JAVA_INTEGRATION_AVAILABLE:
+    api.add_namespace(java_ns)
 
 @api.route('/')
 class Home(Resource):
@@ -155,7 +336,7 @@ class Home(Resource):
             },
             'swagger_ui': '/swagger/',
             'java_integration': {
-                'available': check_java_availability(),
+                'available': JAVA_AVAILABLE,
                 'features': ['Advanced Analytics', 'PDF Reports', 'Maven Artifacts']
             }
         }
@@ -168,7 +349,35 @@ class Feedings(Resource):
     def post(self):
         """Add a new bird feeding record"""
         try:
-            data = request.get_json()
+            if msgspec is not None:
+                # Schema compiled once at import: decode + validate +
+                # coerce straight from the raw bytes in C
+                try:
+                    record = _feeding_decoder.decode(request.get_data(cache=False))
+                except (msgspec.ValidationError, msgspec.DecodeError) as e:
+                    app.observe_logger.log_business_event('feeding_validation_failed', {
+                        'error': str(e)
+                    }, 'WARNING')
+                    api.abort(400, f'Invalid feeding payload: {e}')
+
+                data = {
+                    'bird_type': record.bird_type,
+                    'food_type': record.food_type,
+                    'quantity': record.quantity,
+                    'location': record.location,
+                    'notes': record.notes
+                }
+            else:
+                data = request.get_json()
+
+                # Validate required fields in a single scan
+                missing = next((f for f in REQUIRED_FIELDS if not data.get(f)), None)
+                if missing:
+                    app.observe_logger.log_business_event('feeding_validation_failed', {
+                        'missing_field': missing,
+                        'provided_data': list(data.keys())
+                    }, 'WARNING')
+                    api.abort(400, f'Missing required field: {missing}')
 
             # Log business event
             app.observe_logger.log_business_event('feeding_request_received', {
@@ -177,32 +386,17 @@ class Feedings(Resource):
                 'quantity': data.get('quantity')
             })
 
-            # Validate required fields
-            required_fields = ['bird_type', 'food_type', 'quantity']
-            for field in required_fields:
-                if not data.get(field):
-                    app.observe_logger.log_business_event('feeding_validation_failed', {
-                        'missing_field': field,
-                        'provided_data': list(data.keys())
-                    }, 'WARNING')
-                    api.abort(400, f'Missing required field: {field}')
-
             # Insert into database
-            conn = get_db_connection()
-            cursor = conn.execute('''
-                INSERT INTO bird_feedings (bird_type, food_type, quantity, location, notes)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (
-                data['bird_type'],
-                data['food_type'],
-                int(data['quantity']),
-                data.get('location', ''),
-                data.get('notes', '')
-            ))
-
-            feeding_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
+            with db_conn() as conn:
+                cursor = conn.execute(SQL_INSERT_FEEDING, (
+                    data['bird_type'],
+                    data['food_type'],
+                    int(data['quantity']),
+                    data.get('location', ''),
+                    data.get('notes', '')
+                ))
+
+                feeding_id = cursor.lastrowid
 
             # Log successful creation
             app.observe_logger.log_business_event('feeding_created_successfully', {
@@ -218,6 +412,10 @@ class Feedings(Resource):
                 'timestamp': datetime.datetime.now().isoformat()
             }, 201
 
+        except HTTPException:
+            # The validation 400s above arrive here as HTTPExceptions;
+            # let them through rather than remapping them to a 500
+            raise
         except Exception as e:
             app.observe_logger.log_error(e, {
                 'endpoint': '/feedings/',
@@ -226,38 +424,34 @@ class Feedings(Resource):
             })
             api.abort(500, str(e))
 
-    @feedings_ns.marshal_list_with(feeding_response_model)
+    @feedings_ns.response(200, 'Success', [feeding_response_model])
     @observe_track('bird_feedings_retrieved')
     def get(self):
-        """Get all bird feeding records (limited to 50 most recent)"""
+        """Get all bird feeding records (limited to 50 most recent)
+
+        The rows come straight from sqlite3 with the documented shape,
+        so marshal_list_with's per-field re-coercion is skipped.
+        """
         try:
-            conn = get_db_connection()
-            feedings = conn.execute('''
-                SELECT * FROM bird_feedings
-                ORDER BY feeding_time DESC
-                LIMIT 50
-            ''').fetchall()
-            conn.close()
-
-            # Convert to list of dictionaries
-            feeding_list = []
-            for feeding in feedings:
-                feeding_list.append({
-                    'id': feeding['id'],
-                    'bird_type': feeding['bird_type'],
-                    'food_type': feeding['food_type'],
-                    'quantity': feeding['quantity'],
-                    'location': feeding['location'],
-                    'notes': feeding['notes'],
-                    'feeding_time': feeding['feeding_time']
-                })
+            log_metrics = app.observe_logger.is_enabled('INFO')
+
+            with db_conn() as conn:
+                feedings = conn.execute(SQL_SELECT_RECENT).fetchall()
+                # Skip the metrics aggregation when nothing will log it
+                if log_metrics:
+                    unique_birds, total_quantity = \
+                        conn.execute(SQL_RECENT_METRICS).fetchone()
+
+            # Convert to list of dictionaries (dict(Row) runs in C)
+            feeding_list = [dict(feeding) for feeding in feedings]
 
             # Log business metrics
-            app.observe_logger.log_business_event('feedings_retrieved', {
-                'total_records': len(feeding_list),
-                'unique_birds': len(set(f['bird_type'] for f in feeding_list)),
-                'total_quantity': sum(f['quantity'] for f in feeding_list)
-            })
+            if log_metrics:
+                app.observe_logger.log_business_event('feedings_retrieved', {
+                    'total_records': len(feeding_list),
+                    'unique_birds': unique_birds,
+                    'total_quantity': total_quantity
+                })
 
             return feeding_list
 
@@ -268,44 +462,68 @@ class Feedings(Resource):
             })
             api.abort(500, str(e))
 
+@feedings_ns.route('/bulk/')
+class FeedingsBulk(Resource):
+    @feedings_ns.expect([feeding_model])
+    @observe_track('bird_feedings_bulk_created')
+    def post(self):
+        """Add multiple feeding records in a single transaction"""
+        try:
+            data = request.get_json()
+            if not isinstance(data, list) or not data:
+                api.abort(400, 'Expected a non-empty JSON list of feedings')
+
+            try:
+                rows = [(d['bird_type'], d['food_type'], int(d['quantity']),
+                         d.get('location', ''), d.get('notes', ''))
+                        for d in data]
+            except (KeyError, TypeError, ValueError) as e:
+                api.abort(400, f'Invalid feeding record: {e}')
+
+            # One explicit transaction: N rows share a single fsync
+            with db_conn() as conn:
+                try:
+                    conn.execute('BEGIN')
+                    conn.executemany(SQL_INSERT_FEEDING, rows)
+                    conn.execute('COMMIT')
+                except Exception:
+                    conn.execute('ROLLBACK')
+                    raise
+
+            app.observe_logger.log_business_event('feedings_bulk_created', {
+                'records_inserted': len(rows)
+            })
+
+            return {
+                'message': 'Feedings recorded successfully',
+                'count': len(rows)
+            }, 201
+
+        except HTTPException:
+            # api.abort raises these for the 400s above; let them
+            # propagate instead of remapping every bad payload to a 500
+            raise
+        except Exception as e:
+            app.observe_logger.log_error(e, {
+                'endpoint': '/feedings/bulk/',
+                'method': 'POST'
+            })
+            api.abort(500, str(e))
+
 @stats_ns.route('/')
 class Stats(Resource):
     @stats_ns.marshal_with(stats_model)
     def get(self):
         """Get comprehensive feeding statistics"""
         try:
-            conn = get_db_connection()
-
-            # Total feedings
-            total_feedings = conn.execute('SELECT COUNT(*) FROM bird_feedings').fetchone()[0]
-
-            # Most common bird type
-            common_bird = conn.execute('''
-                SELECT bird_type, COUNT(*) as count
-                FROM bird_feedings
-                GROUP BY bird_type
-                ORDER BY count DESC
-                LIMIT 1
-            ''').fetchone()
-
-            # Most common food type
-            common_food = conn.execute('''
-                SELECT food_type, COUNT(*) as count
-                FROM bird_feedings
-                GROUP BY food_type
-                ORDER BY count DESC
-                LIMIT 1
-            ''').fetchone()
-
-            # Total food quantity
-            total_quantity = conn.execute('SELECT SUM(quantity) FROM bird_feedings').fetchone()[0] or 0
-
-            conn.close()
+            with db_conn() as conn:
+                total_feedings, common_bird, common_food, total_quantity = \
+                    conn.execute(SQL_STATS).fetchone()
 
             return {
                 'total_feedings': total_feedings,
-                'most_common_bird': common_bird[0] if common_bird else None,
-                'most_common_food': common_food[0] if common_food else None,
+                'most_common_bird': common_bird,
+                'most_common_food': common_food,
                 'total_food_quantity': total_quantity
             }
 
@@ -319,26 +537,18 @@ class JavaAnalyze(Resource):
     def post(self):
         """Perform advanced feeding pattern analysis using Java libraries"""
         try:
-            # Get all feeding records for analysis
-            conn = get_db_connection()
-            feedings = conn.execute('''
-                SELECT * FROM bird_feedings
-                ORDER BY feeding_time DESC
-            ''').fetchall()
-            conn.close()
-
-            # Convert to list of dictionaries
-            feeding_list = []
-            for feeding in feedings:
-                feeding_list.append({
-                    'id': feeding['id'],
-                    'bird_type': feeding['bird_type'],
-                    'food_type': feeding['food_type'],
-                    'quantity': feeding['quantity'],
-                    'location': feeding['location'],
-                    'notes': feeding['notes'],
-                    'feeding_time': feeding['feeding_time']
-                })
+            data = request.get_json(silent=True) or {}
+            limit = data.get('limit')
+            offset = data.get('offset', 0)
+
+            # Iterate the cursor lazily instead of fetchall() so the
+            # unbounded scan never holds two copies of the table
+            with db_conn() as conn:
+                if limit is not None:
+                    cursor = conn.execute(SQL_SELECT_PAGE, (int(limit), int(offset)))
+                else:
+                    cursor = conn.execute(SQL_SELECT_ALL)
+                feeding_list = [dict(feeding) for feeding in cursor]
 
             # Log business event
             app.observe_logger.log_business_event('java_analysis_started', {
@@ -347,7 +557,7 @@ class JavaAnalyze(Resource):
             })
 
             # Use Java analyzer
-            analyzer = JavaBirdAnalyzer()
+            analyzer = _get_singleton(JavaBirdAnalyzer)
             analysis_result = analyzer.analyze_feeding_patterns(feeding_list)
 
             # Log successful analysis
@@ -366,49 +576,52 @@ class JavaAnalyze(Resource):
             })
             api.abort(500, str(e))
 
+# Report generation blocks a worker for seconds (full scan + Java
+# subprocess), so jobs run on a small background executor and the POST
+# returns immediately with a job id to poll
+REPORT_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+REPORT_JOBS = {}
+
+def _build_report(report_type, output_path):
+    """Scan, analyze and render one report; runs on a background worker"""
+    analyzer = _get_singleton(JavaBirdAnalyzer)
+    with db_conn() as conn:
+        feeding_list = [dict(feeding) for feeding in conn.execute(SQL_SELECT_ALL)]
+    analysis_data = analyzer.analyze_feeding_patterns(feeding_list)
+
+    report_generator = _get_singleton(JavaReportGenerator)
+    os.makedirs('reports', exist_ok=True)
+    if not report_generator.generate_pdf_report(analysis_data, output_path):
+        raise RuntimeError('Report generation failed')
+
+    app.observe_logger.log_business_event('report_generated', {
+        'report_type': report_type,
+        'output_path': output_path,
+        'records_included': len(feeding_list)
+    })
+    return output_path
+
 @java_ns.route('/report/')
 class JavaReport(Resource):
     @java_ns.expect(report_request_model)
     @observe_track('pdf_report_requested')
     def post(self):
-        """Generate comprehensive PDF reports using Java libraries"""
+        """Queue PDF report generation; returns 202 with a job id to poll"""
         try:
-            data = request.get_json()
+            data = request.get_json(silent=True)
             report_type = data.get('type', 'summary') if data else 'summary'
 
-            # Get analysis data
-            analyzer = JavaBirdAnalyzer()
-            conn = get_db_connection()
-            feedings = conn.execute('''
-                SELECT * FROM bird_feedings
-                ORDER BY feeding_time DESC
-            ''').fetchall()
-            conn.close()
-
-            feeding_list = [dict(feeding) for feeding in feedings]
-            analysis_data = analyzer.analyze_feeding_patterns(feeding_list)
-
-            # Generate report
-            report_generator = JavaReportGenerator()
             output_path = f"reports/bird_feeding_report_{report_type}.pdf"
+            job_id = uuid.uuid4().hex
+            REPORT_JOBS[job_id] = REPORT_EXECUTOR.submit(
+                _build_report, report_type, output_path)
 
-            os.makedirs('reports', exist_ok=True)
-            success = report_generator.generate_pdf_report(analysis_data, output_path)
-
-            if success:
-                app.observe_logger.log_business_event('report_generated', {
-                    'report_type': report_type,
-                    'output_path': output_path,
-                    'records_included': len(feeding_list)
-                })
-
-                return {
-                    'message': 'Report generated successfully',
-                    'path': output_path,
-                    'type': report_type
-                }
-            else:
-                api.abort(500, 'Report generation failed')
+            return {
+                'message': 'Report generation started',
+                'job_id': job_id,
+                'path': output_path,
+                'type': report_type
+            }, 202
 
         except Exception as e:
             app.observe_logger.log_error(e, {
@@ -417,20 +630,36 @@ class JavaReport(Resource):
             })
             api.abort(500, str(e))
 
+@java_ns.route('/report/<string:job_id>')
+class JavaReportStatus(Resource):
+    def get(self, job_id):
+        """Poll the status of a queued report job"""
+        future = REPORT_JOBS.get(job_id)
+        if future is None:
+            api.abort(404, f'Unknown report job: {job_id}')
+
+        if not future.done():
+            return {'job_id': job_id, 'status': 'pending'}
+
+        try:
+            path = future.result()
+        except Exception as e:
+            return {'job_id': job_id, 'status': 'failed', 'error': str(e)}
+
+        return {'job_id': job_id, 'status': 'complete', 'path': path}
+
 @java_ns.route('/status/')
 class JavaStatus(Resource):
     @java_ns.marshal_with(java_status_model)
     def get(self):
         """Check Java integration status and available components"""
         try:
-            java_info = check_java_availability()
+            java_info = JAVA_AVAILABLE
 
-            # Check for JAR files
-            jar_files = []
-            if os.path.exists('java/'):
-                jar_files = [f for f in os.listdir('java/') if f.endswith('.jar')]
+            # Check for JAR files (TTL-cached directory scan)
+            jar_files = _list_jar_files()
 
-            maven_manager = MavenArtifactManager()
+            maven_manager = _get_singleton(MavenArtifactManager)
             available_jars = maven_manager.list_available_jars()
 
             return {
@@ -459,5 +688,10 @@ if __name__ == '__main__':
     print("   POST /java/analyze/       - Advanced Java analysis")
     print("   POST /java/report/        - Generate PDF reports")
     print("   GET  /java/status/        - Java integration status")
+    print("💡 For production use: gunicorn -w 4 --threads 8 -b 0.0.0.0:8000 app_swagger:app")
 
-    app.run(debug=True, host='0.0.0.0', port=8000)
\ No newline at end of file
+    # Dev server only; debug instrumentation is opt-in via FLASK_DEBUG.
+    # threaded=True lets concurrent reads overlap on the pool even in
+    # local runs; under gunicorn the WAL-mode pool serves many readers.
+    app.run(debug=bool(os.environ.get('FLASK_DEBUG')), host='0.0.0.0', port=8000,
+            threaded=True)
\ No newline at end of file
@@ -56,24 +56,59 @@ public class BirdAnalyzer {
         }
     }
     
+    /**
+     * Long-lived worker mode: the Python side keeps one JVM running and
+     * exchanges requests as 4-byte big-endian length-prefixed frames on
+     * stdin/stdout. Exits cleanly when the parent closes the pipe.
+     */
+    private static void runDaemon() throws Exception {
+        BirdAnalyzer analyzer = new BirdAnalyzer();
+        java.io.DataInputStream in = new java.io.DataInputStream(System.in);
+        java.io.DataOutputStream out = new java.io.DataOutputStream(System.out);
+
+        while (true) {
+            int length;
+            try {
+                length = in.readInt();
+            } catch (java.io.EOFException e) {
+                return; // parent closed the pipe - shut down
+            }
+
+            byte[] payload = new byte[length];
+            in.readFully(payload);
+
+            byte[] result = analyzer.analyzePatterns(new String(payload)).getBytes();
+            out.writeInt(result.length);
+            out.write(result);
+            out.flush();
+        }
+    }
+
     /**
      * Command line interface for standalone execution
      */
     public static void main(String[] args) {
-        if (args.length < 1) {
-            System.out.println("Usage: java BirdAnalyzer <json_file>");
-            System.exit(1);
-        }
-        
         try {
-            String jsonContent = new String(java.nio.file.Files.readAllBytes(
-                java.nio.file.Paths.get(args[0])));
-            
+            if (args.length >= 1 && args[0].equals("--daemon")) {
+                runDaemon();
+                return;
+            }
+
+            String jsonContent;
+            if (args.length < 1) {
+                // No file argument: the Python side pipes the JSON
+                // payload over stdin instead of writing a tempfile
+                jsonContent = new String(System.in.readAllBytes());
+            } else {
+                jsonContent = new String(java.nio.file.Files.readAllBytes(
+                    java.nio.file.Paths.get(args[0])));
+            }
+
             BirdAnalyzer analyzer = new BirdAnalyzer();
             String result = analyzer.analyzePatterns(jsonContent);
-            
+
             System.out.println(result);
-            
+
         } catch (Exception e) {
             System.err.println("Error: " + e.getMessage());
             System.exit(1);
@@ -3,10 +3,54 @@ Java Integration Module for Bird Feeding API
 Demonstrates how to use JAR files in a Python project
 """
 
+import atexit
+import functools
 import os
+import shutil
 import subprocess
 import json
+from collections import Counter
 from typing import Dict, Any, List, Optional
+
+# orjson's C encoder/decoder is markedly faster on large feeding batches;
+# fall back to stdlib json when it isn't installed
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    def _dumps_pretty(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj)
+
+    def _dumps_pretty(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+    _loads = json.loads
+
+# numpy is optional (see requirements.txt); used only to vectorize
+# analysis of large feeding batches
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# ijson is optional; lets us parse large Java results incrementally
+# instead of buffering the whole stdout string first
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Payloads above this size take the streaming-parse path. The input size
+# is a proxy - it's the result we parse incrementally, but large results
+# only come from large inputs here
+_STREAM_THRESHOLD = 10 * 1024 * 1024
 # JPype imports - will be imported dynamically when needed
 # import jpype
 # import jpype.imports
@@ -14,17 +58,75 @@ from typing import Dict, Any, List, Optional
 
 class JavaBirdAnalyzer:
     """Python wrapper for Java-based bird analysis functionality"""
-    
+
+    # Long-lived Java worker shared by all instances: JVM startup is paid
+    # once instead of per analysis
+    _worker = None
+    _worker_registered = False
+
+    # Cached jpype module so hot paths skip the sys.modules lookup
+    _jpype = None
+
     def __init__(self, jar_path: str = "java/bird-analyzer.jar"):
         self.jar_path = jar_path
         self.jvm_started = False
-        
+
+    def _get_worker(self):
+        """Spawn (once) a persistent Java worker speaking length-prefixed frames"""
+        cls = JavaBirdAnalyzer
+        if cls._worker is None or cls._worker.poll() is not None:
+            cls._worker = subprocess.Popen(
+                ["java", "-jar", self.jar_path, "--daemon"],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, bufsize=0
+            )
+            if not cls._worker_registered:
+                atexit.register(cls._shutdown_worker)
+                cls._worker_registered = True
+        return cls._worker
+
+    @classmethod
+    def _shutdown_worker(cls):
+        """Terminate the shared Java worker if it is still running"""
+        if cls._worker is not None and cls._worker.poll() is None:
+            cls._worker.terminate()
+        cls._worker = None
+
+    @staticmethod
+    def _read_exact(stream, n: int) -> bytes:
+        """Read exactly n bytes; raw pipes may return short reads"""
+        chunks = []
+        while n > 0:
+            chunk = stream.read(n)
+            if not chunk:
+                raise RuntimeError("Java worker closed the pipe")
+            chunks.append(chunk)
+            n -= len(chunk)
+        return b''.join(chunks)
+
+    def _analyze_via_worker(self, feeding_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Round-trip one analysis through the persistent worker"""
+        worker = self._get_worker()
+        payload = _dumps(feeding_data).encode()
+        worker.stdin.write(len(payload).to_bytes(4, 'big') + payload)
+        worker.stdin.flush()
+
+        header = self._read_exact(worker.stdout, 4)
+        return _loads(self._read_exact(worker.stdout, int.from_bytes(header, 'big')))
+
+    @classmethod
+    def _get_jpype(cls):
+        """Import jpype once and cache the module reference"""
+        if cls._jpype is None:
+            import jpype
+            import jpype.imports
+            cls._jpype = jpype
+        return cls._jpype
+
     def start_jvm(self):
         """Initialize the Java Virtual Machine"""
         try:
-            import jpype
-            import jpype.imports
-            
+            jpype = self._get_jpype()
+
             if not self.jvm_started and not jpype.isJVMStarted():
                 # Start JVM with the JAR file in classpath
                 jpype.startJVM(
@@ -44,7 +146,7 @@ class JavaBirdAnalyzer:
     def shutdown_jvm(self):
         """Shutdown the Java Virtual Machine"""
         try:
-            import jpype
+            jpype = self._get_jpype()
             if self.jvm_started and jpype.isJVMStarted():
                 jpype.shutdownJVM()
                 self.jvm_started = False
@@ -63,7 +165,7 @@ class JavaBirdAnalyzer:
         try:
             # Try to use JPype if available
             try:
-                import jpype
+                self._get_jpype()
                 # Import Java classes (this would be your actual JAR classes)
                 # from com.birdfeeding import BirdAnalyzer
                 # analyzer = BirdAnalyzer()
@@ -80,47 +182,112 @@ class JavaBirdAnalyzer:
     
     def _execute_java_subprocess(self, feeding_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Execute Java analysis using subprocess"""
+        # Prefer the persistent worker - no per-call JVM bootstrap
         try:
-            import tempfile
-            
-            # Create temporary JSON file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                json.dump(feeding_data, f)
-                temp_file = f.name
-            
-            try:
-                # Execute Java program
-                result = execute_java_program(self.jar_path, "com.birdfeeding.BirdAnalyzer", [temp_file])
-                
-                if result['success'] and result['stdout']:
-                    return json.loads(result['stdout'])
-                else:
-                    # Fall back to simulation if Java execution fails
-                    print("⚠️  Java execution failed, using simulation")
-                    return self._simulate_java_analysis(feeding_data)
-                    
-            finally:
-                os.unlink(temp_file)
-                
+            return self._analyze_via_worker(feeding_data)
+        except Exception as e:
+            self._shutdown_worker()
+            print(f"⚠️  Java worker failed: {e}, trying one-shot invocation")
+
+        try:
+            # Stream the JSON over the child's stdin - no tempfile at all,
+            # so there's nothing to pool or recycle: no per-call inode
+            # allocation, directory write, or unlink
+            payload = _dumps(feeding_data).encode()
+
+            if ijson is not None and len(payload) > _STREAM_THRESHOLD:
+                return self._analyze_streaming(payload)
+
+            result = execute_java_program(
+                self.jar_path, "com.birdfeeding.BirdAnalyzer",
+                stdin_bytes=payload
+            )
+
+            if result['success'] and result['stdout']:
+                return _loads(result['stdout'])
+            else:
+                # Fall back to simulation if Java execution fails
+                print("⚠️  Java execution failed, using simulation")
+                return self._simulate_java_analysis(feeding_data)
+
         except Exception as e:
             print(f"⚠️  Subprocess execution failed: {e}, using simulation")
             return self._simulate_java_analysis(feeding_data)
-    
+
+    def _analyze_streaming(self, payload: bytes) -> Dict[str, Any]:
+        """Pipe a large payload through Java and parse stdout incrementally.
+
+        ijson consumes the child's stdout as it is emitted, so peak memory
+        stays proportional to one parse chunk rather than the whole result.
+        """
+        import threading
+
+        proc = subprocess.Popen(
+            ["java", "-jar", self.jar_path],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE
+        )
+
+        # Feed stdin from a thread so the parser can drain stdout
+        # concurrently without deadlocking on full pipes
+        def _feed():
+            try:
+                proc.stdin.write(payload)
+            finally:
+                proc.stdin.close()
+
+        writer = threading.Thread(target=_feed, daemon=True)
+        writer.start()
+
+        result = next(ijson.items(proc.stdout, ''), None)
+        writer.join()
+        proc.wait(timeout=30)
+        # A crashed child can still leave stdout parseable (or empty);
+        # raise so the caller falls back to the simulated analysis
+        if proc.returncode != 0 or not result:
+            raise RuntimeError(
+                f"Java streaming analysis failed (exit {proc.returncode})"
+            )
+        return result
+
     def _simulate_java_analysis(self, feeding_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Simulate what a Java analyzer might return"""
         if not feeding_data:
             return {"patterns": [], "recommendations": []}
-        
-        # Simulate complex analysis that might be better suited for Java
-        bird_types = [f.get('bird_type', '') for f in feeding_data]
-        food_types = [f.get('food_type', '') for f in feeding_data]
-        quantities = [f.get('quantity', 0) for f in feeding_data]
-        
+
+        if np is not None and len(feeding_data) > 1024:
+            # Vectorized path for big batches: np.unique does the mode
+            # counting in C and qty.mean() replaces the Python sum loop.
+            # This is the native-code rung for this workload; a JIT kernel
+            # (numba bincount over interned codes) would still pay the
+            # Python-side dict iteration below, so it buys nothing here
+            birds = np.array([f.get('bird_type', '') for f in feeding_data])
+            foods = np.array([f.get('food_type', '') for f in feeding_data])
+            qty = np.fromiter((f.get('quantity', 0) for f in feeding_data),
+                              dtype=float, count=len(feeding_data))
+            bird_values, bird_freq = np.unique(birds, return_counts=True)
+            food_values, food_freq = np.unique(foods, return_counts=True)
+            most_common_bird = str(bird_values[bird_freq.argmax()])
+            preferred_food = str(food_values[food_freq.argmax()])
+            average_quantity = float(qty.mean())
+        else:
+            # One O(n) pass: Counter modes plus a running quantity sum,
+            # instead of three list copies and O(n*u) max(..., key=count)
+            bird_counts = Counter()
+            food_counts = Counter()
+            total_quantity = 0
+            for f in feeding_data:
+                bird_counts[f.get('bird_type', '')] += 1
+                food_counts[f.get('food_type', '')] += 1
+                total_quantity += f.get('quantity', 0)
+            most_common_bird = bird_counts.most_common(1)[0][0]
+            preferred_food = food_counts.most_common(1)[0][0]
+            average_quantity = total_quantity / len(feeding_data)
+
         return {
             "patterns": {
-                "most_common_bird": max(set(bird_types), key=bird_types.count) if bird_types else None,
-                "preferred_food": max(set(food_types), key=food_types.count) if food_types else None,
-                "average_quantity": sum(quantities) / len(quantities) if quantities else 0,
+                "most_common_bird": most_common_bird,
+                "preferred_food": preferred_food,
+                "average_quantity": average_quantity,
                 "total_feedings": len(feeding_data)
             },
             "recommendations": [
@@ -132,6 +299,24 @@ class JavaBirdAnalyzer:
             "processed_by": "JPype Bridge"
         }
 
+# Fixed report layout, built once at import; per-report work is just
+# rendering the variable slots
+_REPORT_TMPL = """
+🐦 Bird Feeding Analysis Report
+Generated by Java Report Engine
+
+=== FEEDING PATTERNS ===
+{patterns}
+
+=== RECOMMENDATIONS ===
+{recommendations}
+
+=== METADATA ===
+Analysis Engine: {engine}
+Processed By: {processed_by}
+Generated: {timestamp}
+"""
+
 class JavaReportGenerator:
     """Use Java libraries for advanced report generation (e.g., PDF, Excel)"""
     
@@ -157,21 +342,13 @@ class JavaReportGenerator:
     
     def _create_report_content(self, data: Dict[str, Any]) -> str:
         """Create report content (would be enhanced with Java libraries)"""
-        return f"""
-🐦 Bird Feeding Analysis Report
-Generated by Java Report Engine
-
-=== FEEDING PATTERNS ===
-{json.dumps(data.get('patterns', {}), indent=2)}
-
-=== RECOMMENDATIONS ===
-{chr(10).join(f"• {rec}" for rec in data.get('recommendations', []))}
-
-=== METADATA ===
-Analysis Engine: {data.get('analysis_engine', 'Unknown')}
-Processed By: {data.get('processed_by', 'Unknown')}
-Generated: {data.get('timestamp', 'Unknown')}
-"""
+        return _REPORT_TMPL.format(
+            patterns=_dumps_pretty(data.get('patterns', {})),
+            recommendations='\n'.join('• ' + rec for rec in data.get('recommendations', ())),
+            engine=data.get('analysis_engine', 'Unknown'),
+            processed_by=data.get('processed_by', 'Unknown'),
+            timestamp=data.get('timestamp', 'Unknown')
+        )
 
 class MavenArtifactManager:
     """Manage JAR files through Nexus Repository (Maven format)"""
@@ -179,7 +356,12 @@ class MavenArtifactManager:
     def __init__(self, nexus_url: str = "http://localhost:8081"):
         self.nexus_url = nexus_url
         self.maven_repo = "maven-central"  # or your custom Maven repo
-    
+        # Reuse one authenticated session for all Nexus calls so repeated
+        # downloads share a keep-alive connection
+        import requests
+        self.session = requests.Session()
+        self.session.auth = ('admin', 'admin123')
+
     def download_jar(self, group_id: str, artifact_id: str, version: str, 
                      target_dir: str = "java/") -> str:
         """Download JAR file from Nexus Maven repository"""
@@ -192,13 +374,14 @@ class MavenArtifactManager:
             
             jar_path = os.path.join(target_dir, f"{artifact_id}-{version}.jar")
             
-            # Download using requests (could also use Maven CLI)
-            import requests
-            response = requests.get(jar_url, auth=('admin', 'admin123'))
-            
+            # Stream the JAR to disk in chunks instead of holding the
+            # whole artifact in memory via response.content
+            response = self.session.get(jar_url, stream=True, timeout=30)
+
             if response.status_code == 200:
                 with open(jar_path, 'wb') as f:
-                    f.write(response.content)
+                    for chunk in response.iter_content(chunk_size=65536):
+                        f.write(chunk)
                 print(f"📦 Downloaded: {jar_path}")
                 return jar_path
             else:
@@ -224,15 +407,31 @@ class MavenArtifactManager:
             return []
 
 # Utility functions for Java integration
-def execute_java_program(jar_path: str, main_class: str, args: List[str] = None) -> Dict[str, Any]:
-    """Execute a Java program and return results"""
+def execute_java_program(jar_path: str, main_class: str, args: List[str] = None,
+                         stdin_bytes: Optional[bytes] = None) -> Dict[str, Any]:
+    """Execute a Java program and return results.
+
+    When stdin_bytes is given the payload is piped to the child's stdin,
+    so the JVM can start parsing while Python is still writing.
+    """
     try:
         cmd = ["java", "-jar", jar_path]
         if args:
             cmd.extend(args)
-        
+
+        if stdin_bytes is not None:
+            proc = subprocess.Popen(cmd, stdin=subprocess.PIPE,
+                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            stdout, stderr = proc.communicate(stdin_bytes, timeout=30)
+            return {
+                "success": proc.returncode == 0,
+                "stdout": stdout.decode(),
+                "stderr": stderr.decode(),
+                "return_code": proc.returncode
+            }
+
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        
+
         return {
             "success": result.returncode == 0,
             "stdout": result.stdout,
@@ -244,14 +443,24 @@ def execute_java_program(jar_path: str, main_class: str, args: List[str] = None)
     except Exception as e:
         return {"success": False, "error": str(e)}
 
+@functools.lru_cache(maxsize=1)
 def check_java_availability() -> Dict[str, Any]:
-    """Check if Java is available on the system"""
+    """Check if Java is available on the system.
+
+    Cached: the JVM's location doesn't change during process lifetime,
+    so only the first call pays for the `java -version` subprocess.
+    shutil.which replaces the old `which java` fork entirely.
+    """
     try:
-        result = subprocess.run(["java", "-version"], capture_output=True, text=True)
+        java_path = shutil.which("java")
+        if not java_path:
+            return {"available": False, "error": "java not found on PATH"}
+
+        result = subprocess.run([java_path, "-version"], capture_output=True, text=True)
         return {
             "available": result.returncode == 0,
-            "version": result.stderr.split('\n')[0] if result.stderr else "Unknown",
-            "path": subprocess.run(["which", "java"], capture_output=True, text=True).stdout.strip()
+            "version": result.stderr.split('\n', 1)[0] if result.stderr else "Unknown",
+            "path": java_path
         }
     except Exception as e:
         return {"available": False, "error": str(e)}
@@ -6,26 +6,72 @@ Provides structured logging, metrics, and observability features.
 import json
 import logging
 import os
+import queue
+import sys
+import threading
 import time
-import uuid
 from datetime import datetime
 from typing import Dict, Any, Optional
 from functools import wraps
 
 import requests
-import structlog
-from pythonjsonlogger import jsonlogger
 from flask import request, g, current_app
 
+# Prefer orjson's C encoder for per-request log payloads
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    def _dumps_pretty(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    _dumps_bytes = orjson.dumps
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj)
+
+    def _dumps_pretty(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+    def _dumps_bytes(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+def _iso(t: Optional[float] = None) -> str:
+    """ISO timestamp for a time.time() value (defaults to now).
+
+    Events derived from the same request reuse g.start_time rather than
+    calling datetime.utcnow() again for every log field.
+    """
+    return datetime.utcfromtimestamp(t if t is not None else time.time()).isoformat()
+
 class ObserveLogger:
     """Observe.inc integration for Flask applications"""
     
+    # Flush tuning for the background drain thread
+    _BATCH_MAX = 256
+    _BATCH_WINDOW = 0.05
+
     def __init__(self, app=None, config_file='config/observe_config.json'):
         self.app = app
         self.config = {}
         self.session = requests.Session()
         self.enabled = False
-        
+
+        # Snapshotted from config by load_config(); log paths read these
+        # attributes instead of doing two dict lookups per event
+        self._service_name = 'bird-feeding-api'
+        self._customer_id = 'demo'
+        self._environment = 'development'
+        self._log_level = 'INFO'
+        self._threshold = logging.INFO
+
+        # Records queue up and flush in batches off the request path
+        self._q = queue.Queue(maxsize=10000)
+        self._dropped = 0
+        threading.Thread(target=self._drain, daemon=True).start()
+
         if app is not None:
             self.init_app(app, config_file)
     
@@ -44,6 +90,15 @@ class ObserveLogger:
     
     def load_config(self, config_file):
         """Load Observe configuration from file or Nexus"""
+        self._load_config(config_file)
+        observe = self.config.get('observe', {})
+        self._service_name = observe.get('service_name', 'bird-feeding-api')
+        self._customer_id = observe.get('customer_id', 'demo')
+        self._environment = observe.get('environment', 'development')
+        self._log_level = observe.get('log_level', 'INFO')
+        self._threshold = getattr(logging, self._log_level, logging.INFO)
+
+    def _load_config(self, config_file):
         try:
             # Try local file first
             if os.path.exists(config_file):
@@ -82,14 +137,16 @@ class ObserveLogger:
         handler = logging.StreamHandler()
         handler.setFormatter(log_format)
         self.app.logger.addHandler(handler)
-        self.app.logger.setLevel(getattr(logging, self.config['observe'].get('log_level', 'INFO')))
+        self.app.logger.setLevel(getattr(logging, self._log_level))
     
     def setup_request_middleware(self):
         """Set up request/response middleware for observability"""
         
         @self.app.before_request
         def before_request():
-            g.request_id = str(uuid.uuid4())
+            # Correlation ids don't need RFC 4122 structure; raw hex skips
+            # the UUID object allocation on every request
+            g.request_id = os.urandom(16).hex()
             g.start_time = time.time()
             
             self.log_request_start()
@@ -101,9 +158,10 @@ class ObserveLogger:
     
     def log_request_start(self):
         """Log incoming request details"""
-        if not self.enabled:
+        # Guard before format: no dict is built for suppressed levels
+        if not self.enabled or logging.INFO < self._threshold:
             return
-        
+
         log_data = {
             "event_type": "http_request_start",
             "request_id": g.request_id,
@@ -111,17 +169,17 @@ class ObserveLogger:
             "path": request.path,
             "user_agent": request.headers.get('User-Agent', ''),
             "remote_addr": request.remote_addr,
-            "timestamp": datetime.utcnow().isoformat(),
-            "service": self.config['observe'].get('service_name', 'bird-feeding-api')
+            "timestamp": _iso(g.start_time),
+            "service": self._service_name
         }
         
         self.send_to_observe(log_data)
     
     def log_request_end(self, response):
         """Log request completion details"""
-        if not self.enabled:
+        if not self.enabled or logging.INFO < self._threshold:
             return
-        
+
         duration = time.time() - g.start_time
         
         log_data = {
@@ -132,45 +190,69 @@ class ObserveLogger:
             "status_code": response.status_code,
             "duration_ms": round(duration * 1000, 2),
             "response_size": self._get_response_size(response),
-            "timestamp": datetime.utcnow().isoformat(),
-            "service": self.config['observe'].get('service_name', 'bird-feeding-api')
+            "timestamp": _iso(g.start_time + duration),
+            "service": self._service_name
         }
         
         self.send_to_observe(log_data)
 
     def _get_response_size(self, response):
-        """Safely get response size, handling static files and streaming responses"""
+        """Get response size from headers without materializing the body.
+
+        Never calls get_data(): that would buffer streamed/passthrough
+        responses into memory just for a log field. -1 means unknown.
+        """
         try:
-            if hasattr(response, 'content_length') and response.content_length:
+            if getattr(response, 'content_length', None):
                 return response.content_length
-            elif hasattr(response, 'get_data'):
-                return len(response.get_data())
-        except (RuntimeError, AttributeError):
+            content_length = response.headers.get('Content-Length')
+            if content_length:
+                return int(content_length)
+        except (RuntimeError, AttributeError, ValueError):
             # Handle direct passthrough mode for static files
             pass
-        return 0
+        return -1
 
-    def log_business_event(self, event_type: str, data: Dict[str, Any], level: str = "INFO"):
-        """Log business logic events"""
+    def is_enabled(self, level: str = "INFO") -> bool:
+        """Cheap guard so callers can skip building log payloads entirely"""
         if not self.enabled:
+            return False
+        return getattr(logging, level, logging.INFO) >= self._threshold
+
+    def log_business_event(self, event_type: str, data: Dict[str, Any], level: str = "INFO",
+                           request_id: Optional[str] = None,
+                           timestamp: Optional[float] = None):
+        """Log business logic events.
+
+        request_id/timestamp can be captured on the request thread and
+        passed in; flask.g is only touched when they are absent, since it
+        raises RuntimeError outside an application context.
+        """
+        if not self.is_enabled(level):
             return
-        
+
+        if request_id is None:
+            try:
+                request_id = getattr(g, 'request_id', 'no-request')
+            except RuntimeError:
+                request_id = 'no-request'
+
         log_data = {
             "event_type": event_type,
-            "request_id": getattr(g, 'request_id', 'no-request'),
+            "request_id": request_id,
             "level": level,
             "data": data,
-            "timestamp": datetime.utcnow().isoformat(),
-            "service": self.config['observe'].get('service_name', 'bird-feeding-api')
+            "timestamp": _iso(timestamp),
+            "service": self._service_name
         }
-        
+
         self.send_to_observe(log_data)
     
     def log_error(self, error: Exception, context: Dict[str, Any] = None):
         """Log errors with context"""
-        if not self.enabled:
+        if not self.is_enabled("ERROR"):
             return
-        
+
         log_data = {
             "event_type": "error",
             "request_id": getattr(g, 'request_id', 'no-request'),
@@ -178,36 +260,62 @@ class ObserveLogger:
             "error_type": type(error).__name__,
             "error_message": str(error),
             "context": context or {},
-            "timestamp": datetime.utcnow().isoformat(),
-            "service": self.config['observe'].get('service_name', 'bird-feeding-api')
+            "timestamp": _iso(),
+            "service": self._service_name
         }
         
         self.send_to_observe(log_data)
     
     def send_to_observe(self, log_data: Dict[str, Any]):
-        """Send log data to Observe.inc"""
+        """Queue log data for the background flusher"""
         if not self.enabled:
             return
-        
+
         try:
-            # For demo purposes, we'll log to console
-            # In production, you'd send to Observe's collect endpoint
-            observe_config = self.config['observe']
-            
-            # Add standard fields
-            log_data.update({
-                "customer_id": observe_config.get('customer_id', 'demo'),
-                "environment": observe_config.get('environment', 'development'),
-            })
-            
-            # In a real implementation, you'd POST to Observe
-            # requests.post(observe_config['collect_url'], json=log_data, headers={...})
-            
-            # For now, structured logging to console
-            print(f"📊 OBSERVE: {json.dumps(log_data, indent=2)}")
-            
-        except Exception as e:
-            print(f"Error sending to Observe: {e}")
+            self._q.put_nowait(log_data)
+        except queue.Full:
+            # Never block the request thread on a saturated logger
+            self._dropped += 1
+
+    def _drain(self):
+        """Flush queued records in batches, off the request path"""
+        while True:
+            batch = [self._q.get()]
+            deadline = time.monotonic() + self._BATCH_WINDOW
+            while len(batch) < self._BATCH_MAX:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._q.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                # For demo purposes, we'll log to console
+                # In production, you'd POST one batch to Observe's
+                # collect endpoint per flush
+
+                # Add standard fields
+                for log_data in batch:
+                    log_data.update({
+                        "customer_id": self._customer_id,
+                        "environment": self._environment,
+                    })
+
+                # One serialize + one syscall per batch: bytes go straight
+                # to the stream, bypassing print's text-layer writes and
+                # any logging.Formatter %-interpolation
+                line = (f"📊 OBSERVE ({len(batch)} events): ".encode()
+                        + _dumps_bytes(batch) + b"\n")
+                sys.stdout.buffer.write(line)
+                sys.stdout.buffer.flush()
+
+            except Exception as e:
+                print(f"Error sending to Observe: {e}")
+
+# Keys stripped from tracked call arguments before logging
+_SENSITIVE = frozenset(('password', 'token', 'api_key'))
 
 def observe_track(event_type: str, include_args: bool = True):
     """Decorator to automatically track function calls"""
@@ -228,10 +336,13 @@ def observe_track(event_type: str, include_args: bool = True):
                     }
                     
                     if include_args and kwargs:
-                        # Filter out sensitive data
-                        safe_kwargs = {k: v for k, v in kwargs.items() 
-                                     if k not in ['password', 'token', 'api_key']}
-                        data["arguments"] = safe_kwargs
+                        # Skip the filtering dict copy entirely when no
+                        # sensitive keys are present (the common case)
+                        if _SENSITIVE.isdisjoint(kwargs):
+                            data["arguments"] = kwargs
+                        else:
+                            data["arguments"] = {k: v for k, v in kwargs.items()
+                                                 if k not in _SENSITIVE}
                     
                     current_app.observe_logger.log_business_event(event_type, data)
                 
@@ -9,8 +9,14 @@ import subprocess
 import sys
 import json
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# One session for all Nexus REST calls: connection reuse across
+# upload attempts and retries
+NEXUS_SESSION = requests.Session()
+NEXUS_SESSION.auth = ('admin', 'admin123')
+
 def check_prerequisites():
     """Check if Java and Maven are available"""
     print("🔍 Checking prerequisites...")
@@ -55,17 +61,12 @@ def build_java_project():
         return False
     
     try:
-        # Change to Java directory and run Maven build
-        original_dir = os.getcwd()
-        os.chdir(java_dir)
-        
-        # Clean and package
+        # Run Maven in the Java directory via cwd= rather than os.chdir,
+        # which is process-wide and unsafe when steps run concurrently
         result = subprocess.run([
             'mvn', 'clean', 'package', '-DskipTests'
-        ], capture_output=True, text=True)
-        
-        os.chdir(original_dir)
-        
+        ], capture_output=True, text=True, cwd=java_dir)
+
         if result.returncode == 0:
             print("✅ Java project built successfully")
             
@@ -158,17 +159,13 @@ def upload_to_nexus():
         
         # Use Maven deploy plugin
         java_dir = Path("java")
-        original_dir = os.getcwd()
-        os.chdir(java_dir)
-        
+
         result = subprocess.run([
             'mvn', 'deploy',
             f'-DaltDeploymentRepository=nexus-releases::default::{nexus_url}',
             '-DskipTests'
-        ], capture_output=True, text=True)
-        
-        os.chdir(original_dir)
-        
+        ], capture_output=True, text=True, cwd=java_dir)
+
         if result.returncode == 0:
             print("✅ JAR uploaded to Nexus successfully")
             print(f"📍 Available at: {nexus_url}{group_id.replace('.', '/')}/{artifact_id}/{version}/")
@@ -193,14 +190,16 @@ def upload_jar_directly():
         # Upload to raw repository for now
         upload_url = "http://localhost:8081/repository/test-raw/bird-analyzer.jar"
         
+        # A file object streams from disk and lets requests compute the
+        # Content-Length itself; a generator body would force chunked
+        # transfer encoding, which conflicts with an explicit length
         with open(jar_path, 'rb') as f:
-            response = requests.put(
+            response = NEXUS_SESSION.put(
                 upload_url,
                 data=f,
-                auth=('admin', 'admin123'),
                 headers={'Content-Type': 'application/java-archive'}
             )
-        
+
         if response.status_code in [200, 201]:
             print("✅ JAR uploaded to Nexus (raw repository)")
             print(f"📍 Available at: {upload_url}")
@@ -242,21 +241,41 @@ def main():
     print("🚀 Java Integration Setup for Bird Feeding Project")
     print("=" * 60)
     
-    steps = [
-        ("Prerequisites Check", check_prerequisites),
-        ("Install JPype1", install_jpype),
-        ("Build Java Project", build_java_project),
+    print("\n📋 Step: Prerequisites Check")
+    if not check_prerequisites():
+        print("\n❌ Build process failed at: Prerequisites Check")
+        print("Please resolve the issue and try again")
+        sys.exit(1)
+
+    # pip install (network + compile) and mvn package (network + compile)
+    # are independent and both I/O-bound, so run them side by side
+    print("\n📋 Step: Install JPype1 + Build Java Project (parallel)")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        jpype_future = executor.submit(install_jpype)
+        build_future = executor.submit(build_java_project)
+        jpype_ok = jpype_future.result()
+        build_ok = build_future.result()
+
+    if not jpype_ok:
+        print("\n❌ Build process failed at: Install JPype1")
+        print("Please resolve the issue and try again")
+        sys.exit(1)
+    if not build_ok:
+        print("\n❌ Build process failed at: Build Java Project")
+        print("Please resolve the issue and try again")
+        sys.exit(1)
+
+    # Test and upload depend on the built JAR, so they stay sequential
+    for step_name, step_func in [
         ("Test Integration", test_java_integration),
         ("Upload to Nexus", upload_to_nexus)
-    ]
-    
-    for step_name, step_func in steps:
+    ]:
         print(f"\n📋 Step: {step_name}")
         if not step_func():
             print(f"\n❌ Build process failed at: {step_name}")
             print("Please resolve the issue and try again")
             sys.exit(1)
-    
+
     print("\n" + "=" * 60)
     print("🎉 Java integration setup completed successfully!")
     print("\n📝 What's been accomplished:")
@@ -4,11 +4,34 @@ Team setup automation script
 Helps new team members get up and running quickly
 """
 
+import hashlib
 import os
+import shutil
 import subprocess
 import sys
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
+
+# Stamp recording the last successful install; keyed on the
+# requirements hash + interpreter so re-runs can skip pip entirely
+CACHE_FILE = '.setup_cache.json'
+
+def _pip_conf_index(conf_path):
+    """Read index-url from pip.conf (uv doesn't honor PIP_CONFIG_FILE)"""
+    try:
+        import configparser
+        parser = configparser.ConfigParser()
+        parser.read(conf_path)
+        return parser.get('global', 'index-url', fallback=None)
+    except Exception:
+        return None
+
+def _deps_fingerprint():
+    """Hash of requirements.txt plus the Python version"""
+    with open('requirements.txt', 'rb') as f:
+        deps_hash = hashlib.sha256(f.read()).hexdigest()
+    return {'deps_hash': deps_hash, 'python': sys.version}
 
 def check_python_version():
     """Check if Python version is compatible"""
@@ -39,13 +62,45 @@ def install_dependencies():
     try:
         env = os.environ.copy()
         env['PIP_CONFIG_FILE'] = 'config/pip.conf'
-        
-        result = subprocess.run([
-            sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt'
-        ], env=env, capture_output=True, text=True)
-        
+
+        # Skip the pip subprocess (the dominant cost on re-runs) when
+        # requirements.txt is unchanged and the environment still checks out
+        fingerprint = _deps_fingerprint()
+        try:
+            with open(CACHE_FILE) as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            cached = None
+        if cached == fingerprint:
+            check = subprocess.run(
+                [sys.executable, '-m', 'pip', 'check'],
+                env=env, capture_output=True, text=True
+            )
+            if check.returncode == 0:
+                print("✅ Dependencies already installed (requirements unchanged)")
+                return True
+
+        # uv (a Rust pip reimplementation) resolves and downloads in
+        # parallel with a global cache - typically 5-10x faster. It does
+        # NOT read pip.conf, so the Nexus index must be passed explicitly
+        # via UV_INDEX_URL or the install would silently hit public PyPI;
+        # if the index can't be determined, stay on pip
+        uv = shutil.which('uv')
+        index_url = _pip_conf_index('config/pip.conf')
+        if uv and index_url:
+            env['UV_INDEX_URL'] = index_url
+            install_cmd = [uv, 'pip', 'install', '-r', 'requirements.txt']
+        else:
+            install_cmd = [sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt']
+
+        result = subprocess.run(install_cmd, env=env,
+                                capture_output=True, text=True)
+
         if result.returncode == 0:
             print("✅ Dependencies installed successfully")
+            # Stamp only after a successful install
+            with open(CACHE_FILE, 'w') as f:
+                json.dump(fingerprint, f)
             return True
         else:
             print("❌ Failed to install dependencies:")
@@ -79,13 +134,31 @@ def main():
     project_dir = os.path.dirname(script_dir)
     os.chdir(project_dir)
     
+    # The version check is local and the Nexus probe is network I/O with
+    # a 5s timeout; overlapping them keeps a slow Nexus from serializing
+    # the prelude
+    print("\n🔍 Python Version + Nexus Connection...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        py_future = executor.submit(check_python_version)
+        nexus_future = executor.submit(check_nexus_connection)
+        py_ok = py_future.result()
+        nexus_ok = nexus_future.result()
+
+    if not py_ok:
+        print("\n❌ Setup failed at: Python Version")
+        print("Please resolve the issue and try again")
+        sys.exit(1)
+    if not nexus_ok:
+        print("\n❌ Setup failed at: Nexus Connection")
+        print("Please resolve the issue and try again")
+        sys.exit(1)
+
+    # Install and app import depend on the checks above; keep them serial
     checks = [
-        ("Python Version", check_python_version),
-        ("Nexus Connection", check_nexus_connection),
         ("Install Dependencies", install_dependencies),
         ("Test Application", test_application)
     ]
-    
+
     for name, check_func in checks:
         print(f"\n🔍 {name}...")
         if not check_func():
@@ -101,6 +174,7 @@ def main():
     print("3. Test the API: curl http://localhost:8080")
     print("4. Run the demo: python3 scripts/demo_observe.py")
     print("\n💡 For troubleshooting, see: docs/TEAM_SETUP.md")
+    print("💡 Tip: pip install uv to make future dependency installs much faster")
 
 if __name__ == "__main__":
     main()